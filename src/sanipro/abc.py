@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class TokenInterface(ABC):
     """Interface for the token."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, name: str, weight: float) -> None:
         pass
@@ -1,8 +1,11 @@
 import logging
+import typing
 from collections.abc import Set
 
 from sanipro.filters.utils import collect_same_tokens
-from sanipro.pipeline import MutablePrompt
+
+if typing.TYPE_CHECKING:
+    from sanipro.abc import MutablePrompt
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +18,9 @@ class PromptDifferenceDetector:
     reduced_num: int
     duplicated: Set[str]
 
-    def __init__(self, before_process: MutablePrompt, after_process: MutablePrompt):
+    def __init__(
+        self, before_process: "MutablePrompt", after_process: "MutablePrompt"
+    ):
         self.before_num = len(before_process)
         self.after_num = len(after_process)
         self.reduced_num = self.before_num - self.after_num
@@ -1,9 +1,12 @@
 import logging
+import typing
 from abc import ABC, abstractmethod
 
-import networkx
 from sanipro.abc import MutablePrompt, Prompt
 
+if typing.TYPE_CHECKING:
+    import networkx
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,5 +40,5 @@ class MSTBuilder(ABC):
     """MSTを構築する戦略のインターフェース"""
 
     @abstractmethod
-    def build_mst(self, graph: networkx.Graph) -> networkx.Graph:
+    def build_mst(self, graph: "networkx.Graph") -> "networkx.Graph":
         pass
@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 
 class ExcludeCommand(ExecutePrompt):
     def __init__(self, excludes: Sequence[str]):
-        self.excludes = excludes
+        self.excludes = frozenset(excludes)
 
     def execute_prompt(self, prompt: Prompt) -> MutablePrompt:
         """
@@ -1,10 +1,9 @@
 import itertools
 import logging
 import random
+import typing
 from difflib import SequenceMatcher
 
-import networkx as nx
-from networkx import traversal
 from sanipro.abc import MutablePrompt, Prompt, TokenInterface
 from sanipro.filters.abc import (
     ExecutePrompt,
@@ -15,6 +14,9 @@ from sanipro.filters.abc import (
 
 logger = logging.getLogger(__name__)
 
+if typing.TYPE_CHECKING:
+    import networkx as nx
+
 
 try:
     import Levenshtein  # type: ignore
@@ -109,12 +111,16 @@ class GreedyReorderer(ReordererStrategy):
 
 
 class PrimMSTBuilder(MSTBuilder):
-    def build_mst(self, graph: nx.Graph) -> nx.Graph:
+    def build_mst(self, graph: "nx.Graph") -> "nx.Graph":
+        import networkx as nx
+
         return nx.minimum_spanning_tree(graph, algorithm="prim")
 
 
 class KruskalMSTBuilder(MSTBuilder):
-    def build_mst(self, graph: nx.Graph) -> nx.Graph:
+    def build_mst(self, graph: "nx.Graph") -> "nx.Graph":
+        import networkx as nx
+
         return nx.minimum_spanning_tree(graph)
 
 
@@ -127,6 +133,9 @@ class MSTReorderer(ReordererStrategy):
         self.strategy = strategy
 
     def find_optimal_order(self, words: Prompt) -> MutablePrompt:
+        import networkx as nx
+        from networkx import traversal
+
         # construct an edge list for a complete graph
         graph = nx.Graph()
 
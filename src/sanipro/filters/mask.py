@@ -9,7 +9,7 @@ logger = logging.getLogger(__name__)
 
 class MaskCommand(ExecutePrompt):
     def __init__(self, excludes: Sequence[str], replace_to: str):
-        self.excludes = excludes
+        self.excludes = frozenset(excludes)
         self.replace_to = replace_to
 
     def execute_prompt(self, prompt: Prompt) -> MutablePrompt:
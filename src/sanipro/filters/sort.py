@@ -1,9 +1,8 @@
 import logging
-from itertools import chain
 
 from sanipro.abc import MutablePrompt, Prompt
 from sanipro.filters.abc import ExecutePrompt
-from sanipro.filters.utils import collect_same_tokens_sorted
+from sanipro.filters.utils import sort_by_name_and_weight
 
 logger = logging.getLogger(__name__)
 
@@ -24,4 +23,4 @@ class SortCommand(ExecutePrompt):
         >>> [(x.name, x.weight) for x in p]
         [('white hair', 1.2), ('white hair', 1.0)]
         """
-        return list(chain(*collect_same_tokens_sorted(prompt, self.reverse)))
+        return sorted(prompt, key=sort_by_name_and_weight, reverse=self.reverse)
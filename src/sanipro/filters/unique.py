@@ -1,8 +1,9 @@
 import logging
+from itertools import groupby
 
 from sanipro.abc import MutablePrompt, Prompt
 from sanipro.filters.abc import ExecutePrompt
-from sanipro.filters.utils import collect_same_tokens_sorted
+from sanipro.filters.utils import sort_by_name_and_weight, sort_lexicographically
 
 logger = logging.getLogger(__name__)
 
@@ -23,4 +24,7 @@ class UniqueCommand(ExecutePrompt):
         >>> [(x.name, x.weight) for x in p]
         [('white hair', 1.2)]
         """
-        return [vals[0] for vals in collect_same_tokens_sorted(prompt, self.reverse)]
+        tokens = sorted(prompt, key=sort_by_name_and_weight, reverse=self.reverse)
+        return [
+            next(group) for _, group in groupby(tokens, key=sort_lexicographically)
+        ]
@@ -1,5 +1,7 @@
 import collections
+import functools
 import logging
+import operator
 import typing
 from collections.abc import Mapping
 
@@ -15,20 +17,24 @@ def collect_same_tokens(prompts: Prompt) -> Mapping[str, MutablePrompt]:
     return groups
 
 
-def sort_lexicographically(token: TokenInterface) -> str:
-    return token.name
+# C-implemented sort keys; each returns the attribute(s) of a token
+sort_lexicographically = operator.attrgetter("name")
 
+sort_by_name_and_weight = operator.attrgetter("name", "weight")
 
-def sort_by_ord_sum(token: TokenInterface) -> int:
-    return sum(ord(char) for char in token.name)
 
+@functools.lru_cache(maxsize=None)
+def _ord_sum(name: str) -> int:
+    return sum(ord(char) for char in name)
+
+
+def sort_by_ord_sum(token: TokenInterface) -> int:
+    return _ord_sum(token.name)
 
-def sort_by_length(token: TokenInterface) -> int:
-    return token.length
 
+sort_by_length = operator.attrgetter("length")
 
-def sort_by_weight(token: TokenInterface) -> float:
-    return token.weight
+sort_by_weight = operator.attrgetter("weight")
 
 
 def collect_same_tokens_sorted(
@@ -9,6 +9,8 @@ logger = logging.getLogger(__name__)
 
 
 class Token(TokenInterface):
+    __slots__ = ("_name", "_weight")
+
     _delimiter: str
 
     def __init__(self, name: str, weight: float) -> None:
@@ -51,9 +53,9 @@ class Token(TokenInterface):
 
 
 class TokenInteractive(Token):
-    def __init__(self, name: str, weight: float) -> None:
-        Token.__init__(self, name, weight)
-        self._delimiter = ":"
+    __slots__ = ()
+
+    _delimiter = ":"
 
     def __str__(self) -> str:
         if self.weight != 1.0:
@@ -62,11 +64,11 @@ class TokenInteractive(Token):
 
 
 class TokenNonInteractive(Token):
-    def __init__(self, name: str, weight: float) -> None:
-        Token.__init__(self, name, weight)
-        # defining 'delimiter' between token and weight helps to
-        # pass the result of this command to like `column -t -s"\t"`
-        self._delimiter = "\t"
+    __slots__ = ()
+
+    # defining 'delimiter' between token and weight helps to
+    # pass the result of this command to like `column -t -s"\t"`
+    _delimiter = "\t"
 
     def __str__(self) -> str:
         return f"{self.name}{self._delimiter}{self.weight}"
@@ -83,6 +85,8 @@ class DummyParser(ParserInterface):
 
 
 class ParserV1(ParserInterface):
+    re_token = re.compile(r"^(.*?)(?::(\d+(?:\.\d+)?))?$")
+
     @staticmethod
     def extract_token(sentence: str, delimiter: str) -> list[str]:
         """
@@ -138,9 +142,9 @@ class ParserV1(ParserInterface):
 
         return product
 
-    @staticmethod
+    @classmethod
     def parse_line(
-        token_combined: str, token_cls: type[TokenInterface]
+        cls, token_combined: str, token_cls: type[TokenInterface]
     ) -> TokenInterface:
         """
         split `token_combined` into left and right sides with `:`
@@ -165,10 +169,12 @@ class ParserV1(ParserInterface):
         PromptInteractive('re:zero kara hajimeru isekai seikatsu', 1.0)
         """
 
-        name_pattern = r"(.*?)"
-        weight_pattern = r"(\d+(?:\.\d+)?)"
-        pattern = rf"^{name_pattern}(?::{weight_pattern})?$"
-        m = re.match(pattern, token_combined)
+        # fast path: tokens without a colon can never carry a weight,
+        # so skip the regex machinery for them
+        if ":" not in token_combined:
+            return token_cls(token_combined, 1.0)
+
+        m = cls.re_token.match(token_combined)
         if m:
             name = m.group(1)
 
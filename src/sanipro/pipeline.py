@@ -20,7 +20,7 @@ class PromptPipeline(IPromptPipeline):
         self._tokens = []
         self._tokenizer = tokenizer
         self._filter_executor = filterexecutor
-        logger.debug(f"{type(self).__name__} initialized.")
+        logger.debug("%s initialized.", type(self).__name__)
 
     def tokenize(self, source: str) -> MutablePrompt:
         return self._tokenizer.tokenize_prompt(source)
@@ -41,18 +41,10 @@ class SetCalculatorWrapper:
     def create_from(cls, key: str | None = "union") -> Self:
         """Creates the instance from the key"""
 
-        calculator_classes = {
-            cls.union: UnionCalculator,
-            cls.intersection: IntersectionCalculator,
-            cls.difference: DifferenceCalculator,
-            cls.symmetric_difference: SymmetricDifferenceCalculator,
-        }
-        try:
-            calculator_cls = calculator_classes[key]
-            return cls(calculator_cls())
-        except KeyError:
-            # TODO
-            raise
+        calculator_cls = _CALCULATOR_CLASSES.get(key)
+        if calculator_cls is None:
+            raise KeyError(f"unknown set calculator: {key!r}")
+        return cls(calculator_cls())
 
 
 class UnionCalculator(SetCalculator):
@@ -81,3 +73,11 @@ class DifferenceCalculator(SetCalculator):
 
     def do_math(self, a: PromptSet, b: PromptSet) -> PromptSet:
         return a - b
+
+
+_CALCULATOR_CLASSES: dict[str | None, type[SetCalculator]] = {
+    SetCalculatorWrapper.union: UnionCalculator,
+    SetCalculatorWrapper.intersection: IntersectionCalculator,
+    SetCalculatorWrapper.difference: DifferenceCalculator,
+    SetCalculatorWrapper.symmetric_difference: SymmetricDifferenceCalculator,
+}
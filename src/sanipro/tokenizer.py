@@ -1,8 +1,11 @@
 import logging
+import typing
 
 from sanipro.abc import IPromptTokenizer, MutablePrompt, TokenInterface
 from sanipro.delimiter import Delimiter
-from sanipro.parser import ParserInterface
+
+if typing.TYPE_CHECKING:
+    from sanipro.parser import ParserInterface
 
 logger = logging.getLogger(__name__)
 
@@ -11,11 +14,11 @@ class PromptTokenizer(IPromptTokenizer):
     """Tokenize the prompt string using the parser."""
 
     _delimiter: Delimiter
-    _parser: type[ParserInterface]
+    _parser: "type[ParserInterface]"
 
     def __init__(
         self,
-        psr: type[ParserInterface],
+        psr: "type[ParserInterface]",
         token_cls: type[TokenInterface],
         delimiter: Delimiter,
     ) -> None:
@@ -47,10 +50,10 @@ class PromptTokenizer(IPromptTokenizer):
         self._delimiter = value
 
     @property
-    def parser(self) -> type[ParserInterface]:
+    def parser(self) -> "type[ParserInterface]":
         return self._parser
 
-    def update_parser(self, psr: type[ParserInterface]) -> None:
+    def update_parser(self, psr: "type[ParserInterface]") -> None:
         self._parser = psr
 
 